@@ -1,12 +1,35 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+# Optional: gevent (production WSGI server, cheap SSE clients). It has to
+# patch the stdlib before anything imports socket/threading, and ZMQ must
+# then go through zmq.green so polling yields to the other greenlets.
+try:
+    from gevent import monkey
+    monkey.patch_all()
+    from gevent.pywsgi import WSGIServer
+    import zmq.green as zmq
+except ImportError:
+    WSGIServer = None
+    import zmq
+
 import time
-import json
 import threading
-import zmq
+import struct
+import base64
+import dataclasses
+import json
+import orjson
+import numpy as np
 import xmlrpc.client
-from flask import Flask, jsonify, render_template_string, request, make_response
+from flask import Flask, Response, request
+
+# Optional: flask-sock, for binary scope frames over /ws/stream. Without
+# it the page falls back to the SSE stream (/api/stream).
+try:
+    from flask_sock import Sock
+except ImportError:
+    Sock = None
 
 # -----------------------------
 # ZMQ
@@ -16,11 +39,20 @@ ZMQ_AUDIO_ADDR     = "tcp://127.0.0.1:5557"   # scope audio (float) 44.1k
 ZMQ_RDS_SCOPE_ADDR = "tcp://127.0.0.1:5558"   # scope RDS (float)
 ZMQ_CONST_ADDR     = "tcp://127.0.0.1:5559"   # constellation (I/Q)
 
+# One context for the process (a single I/O thread is plenty for 4 SUBs)
+CTX = zmq.Context(io_threads=1)
+
 # -----------------------------
 # XMLRPC (GRC)
 # -----------------------------
 XMLRPC_URL = "http://127.0.0.1:8080"
 
+# One proxy for the whole process: its Transport keeps the HTTP connection
+# and reuses it between calls whenever GRC allows keep-alive. Proxies are
+# not thread-safe, so Flask threads take turns on _RPC_LOCK.
+_RPC = xmlrpc.client.ServerProxy(XMLRPC_URL, allow_none=True)
+_RPC_LOCK = threading.Lock()
+
 # -----------------------------
 # STATIONS (LIVE) — presets
 # freq in MHz (matches your GRC variable "freq")
@@ -31,74 +63,243 @@ STATIONS = [
     {"name": "France Bleu",    "freq": 107.1},
 ]
 
+# STATIONS is constant: the /api/stations body is built once
+_STATIONS_JSON = orjson.dumps([{"name": x["name"], "freq": x["freq"]} for x in STATIONS])
+
 # -----------------------------
 # Flask
 # -----------------------------
 app = Flask(__name__)
 
 # -----------------------------
-# Shared STATE (in-memory)
+# Shared snapshots (in-memory)
 # -----------------------------
-STATE = {
-    "ps": "",
-    "rt": "",
-    "t": 0.0,
-    "last_rx": 0.0,
-    "selected": None,
+# One slot per stream, holding the latest snapshot. Snapshots are frozen
+# dataclasses (orjson encodes them natively), with sample arrays stored as
+# base64 float32 strings (_b64f32). Swapping the slot reference is atomic
+# under the GIL, so readers take no lock.
+@dataclasses.dataclass(frozen=True)
+class StateSnap:
+    ps: str = ""
+    rt: str = ""
+    t: float = 0.0
+    last_rx: float = 0.0
+    selected: object = None
 
     # freq (MHz) tracked locally for UI
-    "freq_mhz": 87.0,
-    "last_freq": 0.0,
+    freq_mhz: float = 87.0
+    last_freq: float = 0.0
 
     # gain tracking (optional, as you had)
-    "gain": 0.0,
-    "last_gain": 0.0,
+    gain: float = 0.0
+    last_gain: float = 0.0
+
+@dataclasses.dataclass(frozen=True)
+class ScopeSnap:
+    y_b64: str = ""
+    sr: float = 0.0
+    rms: float = 0.0
+    peak: float = 0.0
+    t: float = 0.0
+    last_rx: float = 0.0
+
+@dataclasses.dataclass(frozen=True)
+class ConstSnap:
+    i_b64: str = ""
+    q_b64: str = ""
+    peak: float = 0.0
+    n: int = 0
+    t: float = 0.0
+    last_rx: float = 0.0
+
+_SLOTS = {
+    "state": StateSnap(),
+    "audio": ScopeSnap(),
+    "rds_scope": ScopeSnap(),
+    "const": ConstSnap(),
 }
 
-AUDIO = {"y": [], "sr": 0.0, "rms": 0.0, "peak": 0.0, "t": 0.0, "last_rx": 0.0}
-RDS_SCOPE = {"y": [], "sr": 0.0, "rms": 0.0, "peak": 0.0, "t": 0.0, "last_rx": 0.0}
-CONST = {"i": [], "q": [], "n": 0, "t": 0.0, "last_rx": 0.0}
+# "state" has several writers (RDS callback + freq/gain controls): only
+# they serialize their copy-update-publish, readers never wait on it
+_STATE_LOCK = threading.Lock()
+
+# Serialized JSON of each slot, refreshed on publish so GET handlers
+# (polled far more often than some streams update) never re-encode
+_BLOBS = {k: orjson.dumps(v, option=orjson.OPT_SERIALIZE_NUMPY) for k, v in _SLOTS.items()}
+
+# Binary frames for /ws/stream, refreshed on publish like _BLOBS.
+# Header <B3xd3f (stream id, t, three floats) then raw float32 samples:
+#   audio / rds_scope: sr, rms, peak + y
+#   const:             peak, n, 0    + i then q
+_FRAME_HDR = struct.Struct("<B3xd3f")
+_FRAME_IDS = {"audio": 1, "rds_scope": 2, "const": 3}
+_FRAMES = {k: _FRAME_HDR.pack(i, 0.0, 0.0, 0.0, 0.0) for k, i in _FRAME_IDS.items()}
+
+# Scopes are published as a min/max envelope (~canvas width); the capped
+# raw trace is kept aside for endpoints asking for another width (?w=px)
+SCOPE_BINS = 400
+_SCOPE_RAW = {"audio": np.zeros(0, dtype=np.float32), "rds_scope": np.zeros(0, dtype=np.float32)}
+
+# Incoming samples are written into preallocated float32 buffers instead of
+# a fresh ndarray per message. Two per stream, used in turn: the arrays
+# published last are never the ones being overwritten.
+SCOPE_CAP = 1400   # raw samples kept per scope message
+CONST_CAP = 1200   # constellation points kept per message
+
+def _buf_pair(*shape):
+    return [np.empty(shape, dtype=np.float32) for _ in range(2)]
+
+_BUFS = {
+    "audio": _buf_pair(SCOPE_CAP),
+    "rds_scope": _buf_pair(SCOPE_CAP),
+    "const": _buf_pair(2, CONST_CAP),
+}
 
-_LOCK = threading.Lock()
+# Bumped on every publish; /api/stream clients wait on it
+_SEQ = 0
+_SEQ_COND = threading.Condition()
 
 # -----------------------------
 # Helpers
 # -----------------------------
-def rpc_client():
-    return xmlrpc.client.ServerProxy(XMLRPC_URL, allow_none=True)
-
-def _limit_list(lst, nmax):
-    if not isinstance(lst, list):
-        return []
-    if nmax <= 0:
-        return []
-    if len(lst) <= nmax:
-        return lst
-    return lst[-nmax:]
-
-def zmq_json_sub_loop(addr, on_msg, recv_hwm=5):
-    ctx = zmq.Context.instance()
-    s = ctx.socket(zmq.SUB)
-    s.setsockopt(zmq.SUBSCRIBE, b"")
+def _publish(key, snap, frame=None):
+    global _SEQ
+    _BLOBS[key] = orjson.dumps(snap, option=orjson.OPT_SERIALIZE_NUMPY)
+    if frame is not None:
+        _FRAMES[key] = frame
+    _SLOTS[key] = snap
+    with _SEQ_COND:
+        _SEQ += 1
+        _SEQ_COND.notify_all()
+
+def _all_blob():
+    # fixed four-key shape: splice the cached blobs, no re-encode
+    return (
+        b'{"state":' + _BLOBS["state"]
+        + b',"audio":' + _BLOBS["audio"]
+        + b',"rds_scope":' + _BLOBS["rds_scope"]
+        + b',"const":' + _BLOBS["const"]
+        + b'}'
+    )
+
+def _b64f32(a):
+    """Base64 of a as raw little-endian float32 (~5.3 bytes/sample vs ~10 as JSON text)."""
+    return base64.b64encode(np.ascontiguousarray(a, dtype="<f4").tobytes()).decode("ascii")
+
+def _pack_frame(key, t, a, b, c, *arrays):
+    """Binary /ws/stream frame for key: header, then each array as little-endian float32."""
+    return _FRAME_HDR.pack(_FRAME_IDS[key], t, a, b, c) + b"".join(
+        np.ascontiguousarray(x, dtype="<f4").tobytes() for x in arrays
+    )
+
+def _minmax_decimate(y, bins):
+    """Min/max envelope of y over `bins` bins, interleaved [min0, max0, min1, ...]."""
+    if y.size <= 2 * bins:
+        return y
+    # bin edges span the whole trace: no tail dropped when bins doesn't divide y.size
+    edges = np.linspace(0, y.size, bins + 1).astype(np.intp)[:-1]
+    return np.stack([np.minimum.reduceat(y, edges), np.maximum.reduceat(y, edges)], axis=1).ravel()
+
+def _next_buf(key):
+    # swap the pair: the buffer handed out last becomes the spare
+    pair = _BUFS[key]
+    pair.reverse()
+    return pair[0]
+
+def _span(vals, start, stop, step=1):
+    """vals[start:stop:step], without copying the list when that is all of it."""
+    if start == 0 and stop == len(vals) and step == 1:
+        return vals
+    return vals[start:stop:step]
+
+def _ingest_scope(key, vals):
+    """Copy the last SCOPE_CAP samples of vals into a buffer; returns the filled view."""
+    k = min(len(vals), SCOPE_CAP)
+    y = _next_buf(key)[:k]
+    y[:] = _span(vals, len(vals) - k, len(vals))
+    _SCOPE_RAW[key] = y
+    return y
+
+def _update_state(**fields):
+    with _STATE_LOCK:
+        _publish("state", dataclasses.replace(_SLOTS["state"], **fields))
+
+def _loads(msg):
+    """
+    Parse a ZMQ JSON frame (bytes). orjson is the fast path; the GRC
+    publishers use json.dumps, which writes NaN/Infinity for non-finite
+    values and orjson rejects those, so such frames go through json.loads.
+    """
     try:
-        s.setsockopt(zmq.RCVHWM, recv_hwm)
-    except Exception:
-        pass
-    s.connect(addr)
+        return orjson.loads(msg)
+    except orjson.JSONDecodeError:
+        return json.loads(msg)
 
-    while True:
+def zmq_multi_sub_loop(specs):
+    """
+    Single subscriber thread for all ZMQ streams.
+    specs: [(addr, on_msg, recv_hwm, conflate), ...] -- one SUB socket
+    each, polled together and dispatched to on_msg by socket.
+    conflate=True marks a latest-wins stream: ZMQ keeps only the newest
+    message, and whatever still piled up is drained, only the last parsed.
+    """
+    poller = zmq.Poller()
+    handlers = {}
+    for addr, on_msg, recv_hwm, conflate in specs:
+        s = CTX.socket(zmq.SUB)
+        s.setsockopt(zmq.SUBSCRIBE, b"")
+        # never block shutdown/reload on pending messages
+        s.setsockopt(zmq.LINGER, 0)
         try:
-            msg = s.recv()
-            d = json.loads(msg.decode("utf-8", errors="ignore"))
-            on_msg(d)
+            s.setsockopt(zmq.RCVHWM, recv_hwm)
         except Exception:
-            time.sleep(0.01)
+            pass
+        # CONFLATE must be set before connect() to take effect
+        if conflate:
+            s.setsockopt(zmq.CONFLATE, 1)
+        s.connect(addr)
+        poller.register(s, zmq.POLLIN)
+        handlers[s] = (on_msg, conflate)
+
+    while True:
+        for s, _ in poller.poll():
+            on_msg, latest_only = handlers[s]
+            try:
+                msg = s.recv(zmq.NOBLOCK)
+                while latest_only:
+                    try:
+                        msg = s.recv(zmq.NOBLOCK)
+                    except zmq.Again:
+                        break
+                # parsed from the raw frame (bytes), no str copy
+                on_msg(_loads(msg))
+            except zmq.Again:
+                # spurious wakeup: nothing to read, just poll again
+                continue
+            except Exception:
+                time.sleep(0.01)
+
+NOSTORE_HEADERS = {
+    "Cache-Control": "no-store, no-cache, must-revalidate, max-age=0",
+    "Pragma": "no-cache",
+}
+
+# Full static header list for JSON bodies: no mimetype / header munging
+_HDRS = [*NOSTORE_HEADERS.items(), ("Content-Type", "application/json")]
+
+def fast_json(body_bytes):
+    return Response(body_bytes, headers=_HDRS)
 
 def json_nostore(payload):
-    resp = make_response(jsonify(payload))
-    resp.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
-    resp.headers["Pragma"] = "no-cache"
-    return resp
+    return fast_json(orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY))
+
+def scope_nostore(key):
+    # ?w=<px>: re-bin the raw trace for that canvas width (not cached)
+    w = request.args.get("w", type=int)
+    if not w:
+        return fast_json(_BLOBS[key])
+    y = _minmax_decimate(_SCOPE_RAW[key], min(max(w, 1), 4096))
+    return json_nostore(dataclasses.replace(_SLOTS[key], y_b64=_b64f32(y)))
 
 def _set_freq_mhz(mhz, selected_name=None):
     """
@@ -110,80 +311,95 @@ def _set_freq_mhz(mhz, selected_name=None):
     if mhz < 87.0: mhz = 87.0
     if mhz > 108.0: mhz = 108.0
 
-    rpc = rpc_client()
-    rpc.set_freq(mhz)  # IMPORTANT: your GRC variable must be named "freq"
+    with _RPC_LOCK:
+        _RPC.set_freq(mhz)  # IMPORTANT: your GRC variable must be named "freq"
 
-    with _LOCK:
-        STATE["freq_mhz"] = mhz
-        STATE["last_freq"] = time.time()
-        STATE["selected"] = selected_name  # None if manual
+    _update_state(
+        freq_mhz=mhz,
+        last_freq=time.time(),
+        selected=selected_name,  # None if manual
+    )
     return mhz
 
 # -----------------------------
 # ZMQ callbacks
 # -----------------------------
 def on_rds(d):
-    with _LOCK:lspci | grep -i vga
-        STATE["ps"] = d.get("ps", "") or ""
-        STATE["rt"] = d.get("rt", "") or ""
-        STATE["t"] = float(d.get("t", 0.0) or 0.0)
-        STATE["last_rx"] = time.time()
+    _update_state(
+        ps=d.get("ps") or "",
+        rt=d.get("rt") or "",
+        t=float(d.get("t") or 0.0),
+        last_rx=time.time(),
+    )
 
 def on_audio(d):
-    with _LOCK:
-        AUDIO["y"] = _limit_list(d.get("y", []) or [], 1400)
-        AUDIO["sr"] = float(d.get("sr", 0.0) or 0.0)
-        AUDIO["rms"] = float(d.get("rms", 0.0) or 0.0)
-        AUDIO["peak"] = float(d.get("peak", 0.0) or 0.0)
-        AUDIO["t"] = float(d.get("t", 0.0) or 0.0)
-        AUDIO["last_rx"] = time.time()
+    y = _minmax_decimate(_ingest_scope("audio", d.get("y") or ()), SCOPE_BINS)
+    snap = ScopeSnap(
+        y_b64=_b64f32(y),
+        sr=float(d.get("sr") or 0.0),
+        rms=float(d.get("rms") or 0.0),
+        peak=float(d.get("peak") or 0.0),
+        t=float(d.get("t") or 0.0),
+        last_rx=time.time(),
+    )
+    _publish("audio", snap, _pack_frame("audio", snap.t, snap.sr, snap.rms, snap.peak, y))
 
 def on_rds_scope(d):
-    with _LOCK:
-        RDS_SCOPE["y"] = _limit_list(d.get("y", []) or [], 1400)
-        RDS_SCOPE["sr"] = float(d.get("sr", 0.0) or 0.0)
-        RDS_SCOPE["rms"] = float(d.get("rms", 0.0) or 0.0)
-        RDS_SCOPE["peak"] = float(d.get("peak", 0.0) or 0.0)
-        RDS_SCOPE["t"] = float(d.get("t", 0.0) or 0.0)
-        RDS_SCOPE["last_rx"] = time.time()
+    y = _minmax_decimate(_ingest_scope("rds_scope", d.get("y") or ()), SCOPE_BINS)
+    snap = ScopeSnap(
+        y_b64=_b64f32(y),
+        sr=float(d.get("sr") or 0.0),
+        rms=float(d.get("rms") or 0.0),
+        peak=float(d.get("peak") or 0.0),
+        t=float(d.get("t") or 0.0),
+        last_rx=time.time(),
+    )
+    _publish("rds_scope", snap, _pack_frame("rds_scope", snap.t, snap.sr, snap.rms, snap.peak, y))
 
 def on_const(d):
-    with _LOCK:
-        I = _limit_list(d.get("i", []) or [], 1200)
-        Q = _limit_list(d.get("q", []) or [], 1200)
-        n = min(len(I), len(Q))
-        CONST["i"] = I[:n]
-        CONST["q"] = Q[:n]
-        CONST["n"] = int(d.get("n", n) or n)
-        CONST["t"] = float(d.get("t", 0.0) or 0.0)
-        CONST["last_rx"] = time.time()
+    i = d.get("i") or ()
+    q = d.get("q") or ()
+    n = min(len(i), len(q))
+    step = max(1, -(-n // CONST_CAP))  # even subsample, <= CONST_CAP points
+    # subsampled lists go straight into a (2, CONST_CAP) buffer; rows are contiguous
+    IQ = _next_buf("const")[:, :len(range(0, n, step))]
+    IQ[0] = _span(i, 0, n, step)
+    IQ[1] = _span(q, 0, n, step)
+    I, Q = IQ
+    # scale for drawConst, computed once here instead of per redraw
+    peak = float(np.abs(IQ).max()) if IQ.size else 0.0
+    snap = ConstSnap(
+        i_b64=_b64f32(I),
+        q_b64=_b64f32(Q),
+        peak=peak,
+        n=int(d.get("n") or I.size),
+        t=float(d.get("t") or 0.0),
+        last_rx=time.time(),
+    )
+    _publish("const", snap, _pack_frame("const", snap.t, peak, snap.n, 0.0, I, Q))
 
 # -----------------------------
 # APIs
 # -----------------------------
 @app.route("/api/state")
 def api_state():
-    with _LOCK:
-        return json_nostore(dict(STATE))
+    return fast_json(_BLOBS["state"])
 
 @app.route("/api/audio")
 def api_audio():
-    with _LOCK:
-        return json_nostore(dict(AUDIO))
+    return scope_nostore("audio")
 
 @app.route("/api/rds_scope")
 def api_rds_scope():
-    with _LOCK:
-        return json_nostore(dict(RDS_SCOPE))
+    return scope_nostore("rds_scope")
 
 @app.route("/api/const")
 def api_const():
-    with _LOCK:
-        return json_nostore(dict(CONST))
+    return fast_json(_BLOBS["const"])
 
 @app.route("/api/stations")
 def api_stations():
-    return json_nostore([{"name": x["name"], "freq": x["freq"]} for x in STATIONS])
+    return fast_json(_STATIONS_JSON)
 
 @app.route("/api/select", methods=["POST"])
 def api_select():
@@ -230,25 +446,55 @@ def api_gain():
     if g > 45.0: g = 45.0
 
     try:
-        rpc = rpc_client()
-        rpc.set_gain(g)  # requires GRC variable named "gain"
-        with _LOCK:
-            STATE["gain"] = g
-            STATE["last_gain"] = time.time()
+        with _RPC_LOCK:
+            _RPC.set_gain(g)  # requires GRC variable named "gain"
+        _update_state(gain=g, last_gain=time.time())
         return json_nostore({"ok": True, "gain": g})
     except Exception as e:
         return json_nostore({"ok": False, "error": str(e)}), 500
 
 @app.route("/api/all")
 def api_all():
-    with _LOCK:
-        payload = {
-            "state": dict(STATE),
-            "audio": dict(AUDIO),
-            "rds_scope": dict(RDS_SCOPE),
-            "const": dict(CONST),
-        }
-    return json_nostore(payload)
+    return fast_json(_all_blob())
+
+# ---- Server-Sent Events: same payload as /api/all, pushed on publish
+STREAM_MIN_DT = 0.05   # coalesce bursts: at most ~20 frames/s per client
+STREAM_IDLE_DT = 1.0   # resend when idle so age/LED keep ticking
+
+@app.route("/api/stream")
+def api_stream():
+    def events():
+        seen = -1
+        while True:
+            with _SEQ_COND:
+                _SEQ_COND.wait_for(lambda: _SEQ != seen, timeout=STREAM_IDLE_DT)
+                seen = _SEQ
+            yield b"data: " + _all_blob() + b"\n\n"
+            time.sleep(STREAM_MIN_DT)
+
+    return Response(events(), mimetype="text/event-stream",
+                    headers={**NOSTORE_HEADERS, "X-Accel-Buffering": "no"})
+
+# ---- WebSocket: state as a JSON text message, scopes as binary frames
+# (see _FRAME_HDR), each sent only when it changed; same pacing as SSE
+if Sock is not None:
+    sock = Sock(app)
+
+    @sock.route("/ws/stream")
+    def ws_stream(ws):
+        seen = -1
+        sent = {}
+        while True:
+            with _SEQ_COND:
+                _SEQ_COND.wait_for(lambda: _SEQ != seen, timeout=STREAM_IDLE_DT)
+                seen = _SEQ
+            # state always goes out so age/LED keep ticking
+            ws.send(_BLOBS["state"].decode("utf-8"))
+            for key, frame in list(_FRAMES.items()):
+                if sent.get(key) is not frame:
+                    ws.send(frame)
+                    sent[key] = frame
+            time.sleep(STREAM_MIN_DT)
 
 # -----------------------------
 # UI
@@ -547,6 +793,15 @@ const gaintxt = document.getElementById("gaintxt");
 let gainLastSent = -999;
 let gainCooldownUntil = 0;
 
+// scope/constellation samples arrive as base64 little-endian float32
+function f32(b64){
+  if(!b64) return null;
+  const bin = atob(b64);
+  const buf = new Uint8Array(bin.length);
+  for(let i=0;i<bin.length;i++) buf[i]=bin.charCodeAt(i);
+  return new Float32Array(buf.buffer);
+}
+
 function resize(c){
   const dpr = window.devicePixelRatio || 1;
   const r = c.getBoundingClientRect();
@@ -594,14 +849,14 @@ function setCursorFreq(freq){
   cursor.style.left = `${x}px`;
 }
 
-function drawScope(canvas, ctx, y){
+function drawScope(canvas, ctx, y, peak){
   resize(canvas);
   const W=canvas.width,H=canvas.height;
   ctx.clearRect(0,0,W,H);
   if(!y||y.length<2)return;
 
-  let max=0;
-  for(const v of y) max=Math.max(max,Math.abs(v));
+  // peak = max|y|, sent with the frame
+  let max = peak || 0;
   if(max<1e-6)max=1;
 
   ctx.globalAlpha=0.14;
@@ -623,7 +878,7 @@ function drawScope(canvas, ctx, y){
   ctx.stroke();
 }
 
-function drawConst(canvas, ctx, I, Q){
+function drawConst(canvas, ctx, I, Q, peak){
   resize(canvas);
   const W=canvas.width,H=canvas.height;
   ctx.clearRect(0,0,W,H);
@@ -643,18 +898,12 @@ function drawConst(canvas, ctx, I, Q){
   ctx.stroke();
   ctx.globalAlpha=1.0;
 
-  let max=0;
-  for(let k=0;k<I.length;k++){
-    const a = Math.abs(I[k]), b = Math.abs(Q[k]);
-    if(a>max) max=a;
-    if(b>max) max=b;
-  }
+  let max = peak || 0;
   if(max<1e-6)max=1;
   const sx=(W/2)/(max*1.2), sy=(H/2)/(max*1.2);
 
   ctx.fillStyle="white";
-  const step = Math.max(1, Math.floor(I.length/1200));
-  for(let k=0;k<I.length;k+=step){
+  for(let k=0;k<I.length;k++){
     const x=W/2 + I[k]*sx;
     const y=H/2 - Q[k]*sy;
     ctx.fillRect(x, y, 2, 2);
@@ -771,13 +1020,8 @@ gainEl.addEventListener("input", ()=>{
   }
 });
 
-async function tick(){
-  const all = await (await fetch("/api/all",{cache:"no-store"})).json();
-
-  const st = all.state || {};
-  const a  = all.audio || {};
-  const r  = all.rds_scope || {};
-  const co = all.const || {};
+function applyState(st){
+  st = st || {};
 
   // selection label
   selected = (st.selected !== undefined && st.selected !== null) ? st.selected : selected;
@@ -820,34 +1064,78 @@ async function tick(){
       gaintxt.textContent = "sync";
     }
   }
+}
 
-  // scopes
+function applyAudio(a){
   if ((a.t||0) !== lastAudioT){
-    drawScope(cAudio, xAudio, a.y);
+    drawScope(cAudio, xAudio, a.y || f32(a.y_b64), a.peak);
     lastAudioT = a.t||0;
   }
   document.getElementById("a_rms").textContent = (a.rms||0).toFixed(3);
   document.getElementById("a_peak").textContent = (a.peak||0).toFixed(3);
   document.getElementById("a_sr").textContent = Math.round(a.sr||0);
+}
 
+function applyRds(r){
   if ((r.t||0) !== lastRdsT){
-    drawScope(cRds, xRds, r.y);
+    drawScope(cRds, xRds, r.y || f32(r.y_b64), r.peak);
     lastRdsT = r.t||0;
   }
   document.getElementById("r_rms").textContent = (r.rms||0).toFixed(3);
   document.getElementById("r_peak").textContent = (r.peak||0).toFixed(3);
   document.getElementById("r_sr").textContent = Math.round(r.sr||0);
+}
 
+function applyConst(co){
   if ((co.t||0) !== lastConstT){
-    drawConst(cConst, xConst, co.i, co.q);
+    drawConst(cConst, xConst, co.i || f32(co.i_b64), co.q || f32(co.q_b64), co.peak);
     lastConstT = co.t||0;
   }
   document.getElementById("cn").textContent = co.n || 0;
 }
 
+// SSE frame: everything as JSON (samples base64)
+function applyFrame(all){
+  applyState(all.state);
+  applyAudio(all.audio || {});
+  applyRds(all.rds_scope || {});
+  applyConst(all.const || {});
+}
+
+// WebSocket binary frame: <B3xd3f header (id, t, 3 floats) + float32 samples
+const FRAME_HDR = 24;
+function dispatchFrame(dv){
+  const id = dv.getUint8(0), t = dv.getFloat64(4, true);
+  const f0 = dv.getFloat32(12, true), f1 = dv.getFloat32(16, true), f2 = dv.getFloat32(20, true);
+  const v = new Float32Array(dv.buffer, FRAME_HDR);
+  if(id === 1) applyAudio({t, sr:f0, rms:f1, peak:f2, y:v});
+  else if(id === 2) applyRds({t, sr:f0, rms:f1, peak:f2, y:v});
+  else if(id === 3){
+    const m = v.length/2;
+    applyConst({t, peak:f0, n:f1, i:v.subarray(0, m), q:v.subarray(m)});
+  }
+}
+
 loadStations();
-setInterval(tick, 250);
-tick();
+// WebSocket with binary scope frames when the server has it (flask-sock);
+// if it never opens, fall back to SSE
+function startSSE(){
+  const es = new EventSource("/api/stream");
+  es.onmessage = (e)=>applyFrame(JSON.parse(e.data));
+}
+
+function connect(){
+  const ws = new WebSocket((location.protocol === "https:" ? "wss://" : "ws://") + location.host + "/ws/stream");
+  ws.binaryType = "arraybuffer";
+  let opened = false;
+  ws.onopen = ()=>{ opened = true; };
+  ws.onmessage = (e)=>{
+    if(typeof e.data === "string") applyState(JSON.parse(e.data));
+    else dispatchFrame(new DataView(e.data));
+  };
+  ws.onclose = ()=>{ if(opened) setTimeout(connect, 1000); else startSSE(); };
+}
+connect();
 
 window.addEventListener("resize", ()=>{
   lastAudioT = 0; lastRdsT = 0; lastConstT = 0;
@@ -861,22 +1149,25 @@ window.addEventListener("resize", ()=>{
 </html>
 """
 
+# PAGE is static (no template variables): encode it once
+PAGE_BYTES = PAGE.encode("utf-8")
+
 @app.route("/")
 def index():
-    resp = make_response(render_template_string(PAGE))
-    resp.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
-    resp.headers["Pragma"] = "no-cache"
-    return resp
+    return Response(PAGE_BYTES, mimetype="text/html", headers=NOSTORE_HEADERS)
 
 # -----------------------------
 # Main
 # -----------------------------
 if __name__ == "__main__":
-    # Start ZMQ subscribers (low HWM to avoid backlog)
-    threading.Thread(target=zmq_json_sub_loop, args=(ZMQ_RDS_ADDR, on_rds, 10), daemon=True).start()
-    threading.Thread(target=zmq_json_sub_loop, args=(ZMQ_AUDIO_ADDR, on_audio, 3), daemon=True).start()
-    threading.Thread(target=zmq_json_sub_loop, args=(ZMQ_RDS_SCOPE_ADDR, on_rds_scope, 3), daemon=True).start()
-    threading.Thread(target=zmq_json_sub_loop, args=(ZMQ_CONST_ADDR, on_const, 3), daemon=True).start()
+    # Start ZMQ subscribers: one polling thread (low HWM to avoid backlog)
+    # ps/rt: every message matters; scopes/const: only the latest is drawn
+    threading.Thread(target=zmq_multi_sub_loop, args=([
+        (ZMQ_RDS_ADDR, on_rds, 10, False),
+        (ZMQ_AUDIO_ADDR, on_audio, 3, True),
+        (ZMQ_RDS_SCOPE_ADDR, on_rds_scope, 3, True),
+        (ZMQ_CONST_ADDR, on_const, 3, True),
+    ],), daemon=True).start()
 
     # Optional: initialize freq to 87.0 MHz at startup
     try:
@@ -884,4 +1175,7 @@ if __name__ == "__main__":
     except Exception:
         pass
 
-    app.run(host="0.0.0.0", port=5000, debug=False, threaded=True)
+    if WSGIServer is not None:
+        WSGIServer(("0.0.0.0", 5000), app).serve_forever()
+    else:
+        app.run(host="0.0.0.0", port=5000, debug=False, threaded=True)